@@ -9,8 +9,16 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import io
+import os
+import sys
+import signal
+import threading
 import base64
 import json
+import hmac
+import tracemalloc
+import uuid
+from collections import OrderedDict
 from typing import Dict, List, Any
 import numpy as np
 
@@ -24,7 +32,10 @@ CORS(app)  # Allow requests from Next.js frontend
 # Charts MUST use dark backgrounds to match
 
 sns.set_style("dark")
-plt.rcParams['figure.figsize'] = (10, 6)  # Fixed size for uniform appearance
+# Chart functions call plt.figure() without a size, so the endpoint sets these
+# per chart from its "figsize" and "dpi"
+plt.rcParams['figure.figsize'] = (10, 6)  # Default size; charts may override via "figsize"
+plt.rcParams['savefig.dpi'] = 100         # Default DPI; charts may override via "dpi"
 plt.rcParams['font.size'] = 11
 plt.rcParams['font.family'] = 'sans-serif'
 plt.rcParams['axes.labelsize'] = 12
@@ -65,10 +76,147 @@ GRADIENT_COLORS = [
     '#f59e0b',  # amber-500
 ]
 
+# ==========================================
+# TIME-SERIES RESAMPLING
+# ==========================================
+# Datetime x-axes are bucketed so a chart never draws more points than its
+# width can show. Candidate frequencies with their approximate bucket length,
+# finest first.
+RESAMPLE_FREQUENCIES = [
+    ('min', pd.Timedelta(minutes=1)),
+    ('5min', pd.Timedelta(minutes=5)),
+    ('15min', pd.Timedelta(minutes=15)),
+    ('30min', pd.Timedelta(minutes=30)),
+    ('h', pd.Timedelta(hours=1)),
+    ('6h', pd.Timedelta(hours=6)),
+    ('12h', pd.Timedelta(hours=12)),
+    ('D', pd.Timedelta(days=1)),
+    ('W', pd.Timedelta(weeks=1)),
+    ('MS', pd.Timedelta(days=30)),
+    ('QS', pd.Timedelta(days=91)),
+    ('YS', pd.Timedelta(days=365)),
+]
+POINTS_PER_INCH = 12  # ~120 buckets on a 10-inch wide figure
+EXPLICIT_FREQ_BUCKET_FACTOR = 10  # An explicit mapping.freq may use up to 10x that
+
+# Dashboard aggregation names → pandas reducer names
+AGGREGATION_FUNCS = {
+    'sum': 'sum',
+    'avg': 'mean',
+    'count': 'count',
+    'min': 'min',
+    'max': 'max',
+}
+
+
+def parse_datetime_column(series: pd.Series):
+    """Return the series as datetimes, or None if it is not a time column"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    # Only text columns are candidates; numbers would parse as epoch offsets
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return None
+
+    non_null = series.dropna().astype(str)
+    # Labels without digits ("January", "Q1 East") are categories, not dates
+    if non_null.empty or not non_null.str.contains(r'\d').all():
+        return None
+
+    try:
+        parsed = pd.to_datetime(series, errors='coerce')
+    except ValueError:
+        parsed = None
+    if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+        # Mixed UTC offsets (local-time exports spanning a DST change) raise on
+        # pandas 3 and come back as object dtype on pandas 2
+        parsed = pd.to_datetime(series, errors='coerce', utc=True)
+    # Require most values to parse so mixed free text stays categorical
+    if parsed.notna().sum() < 0.9 * len(non_null):
+        return None
+    return parsed
+
+
+def max_time_points(fig_width: float = None) -> int:
+    """Number of time buckets a figure of this width can show"""
+    fig_width = fig_width or plt.rcParams['figure.figsize'][0]
+    return max(int(fig_width * POINTS_PER_INCH), 2)
+
+
+def finest_fitting_freq(span: pd.Timedelta, max_points: int) -> str:
+    """Finest candidate frequency that splits `span` into at most max_points buckets"""
+    for freq, bucket in RESAMPLE_FREQUENCIES:
+        if span / bucket <= max_points:
+            return freq
+    return RESAMPLE_FREQUENCIES[-1][0]
+
+
+def pick_resample_freq(times: pd.Series, fig_width: float = None):
+    """Pick the finest frequency that keeps the bucket count within the figure width"""
+    max_points = max_time_points(fig_width)
+
+    if times.nunique() <= max_points:
+        return None  # Few enough timestamps to plot each one
+
+    return finest_fitting_freq(times.max() - times.min(), max_points)
+
+
+def limit_resample_freq(times: pd.Series, freq: str, fig_width: float = None) -> str:
+    """Coarsen an explicit frequency that would create too many buckets"""
+    max_buckets = max_time_points(fig_width) * EXPLICIT_FREQ_BUCKET_FACTOR
+    offset = pd.tseries.frequencies.to_offset(freq)
+    start = times.min()
+    try:
+        bucket = pd.Timedelta(offset)
+    except ValueError:
+        # Calendar offsets (day, week, month...) have no fixed length; measure one
+        bucket = (start + 2 * offset) - (start + offset)
+
+    span = times.max() - start
+    if bucket <= pd.Timedelta(0) or span / bucket > max_buckets:
+        return finest_fitting_freq(span, max_buckets)
+    return freq
+
+
+def prepare_time_series(data: pd.DataFrame, x_col: str, y_cols: list, aggregation: str = 'sum',
+                        freq: str = None, fig_width: float = None):
+    """
+    Aggregate y_cols along x_col for line/area style charts.
+
+    Datetime x columns are parsed once and resampled to `freq` (or a frequency
+    picked from the time range and figure width); an explicit `freq` that would
+    create too many buckets is coarsened. Other x columns are grouped
+    on their exact values. Input that is already ordered skips the sort.
+    """
+    agg_func = AGGREGATION_FUNCS.get(aggregation, 'sum')
+    y_cols = [col for col in y_cols if col in data.columns]
+    df = data[[x_col] + y_cols]
+
+    times = parse_datetime_column(df[x_col])
+    if times is not None:
+        df = df.assign(**{x_col: times}).dropna(subset=[x_col])
+
+    if not df[x_col].is_monotonic_increasing:
+        df = df.sort_values(x_col, kind='stable')
+
+    if times is not None:
+        if freq:
+            freq = limit_resample_freq(df[x_col], freq, fig_width)
+        else:
+            freq = pick_resample_freq(df[x_col], fig_width)
+        if freq:
+            grouped = df.set_index(x_col)[y_cols].resample(freq)
+            # min_count leaves empty buckets as NaN, so lines break at gaps
+            df_agg = grouped.sum(min_count=1) if agg_func == 'sum' else grouped.agg(agg_func)
+            return df_agg.reset_index()
+
+    # Input is sorted, so groupby can skip its own sort
+    return df.groupby(x_col, sort=False)[y_cols].agg(agg_func).reset_index()
+
 
 def generate_bar_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str, aggregation: str = 'sum'):
     """Generate a dark-themed bar chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     if aggregation == 'sum':
         df_agg = data.groupby(x_col)[y_col].sum().reset_index()
@@ -96,19 +244,20 @@ def generate_bar_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str, a
     return save_plot_to_base64()
 
 
-def generate_line_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
+def generate_line_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str,
+                        aggregation: str = 'sum', freq: str = None):
     """Generate a dark-themed line chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
-    df_sorted = data.sort_values(x_col)
+    df_agg = prepare_time_series(data, x_col, [y_col], aggregation, freq)
 
     # Use vibrant purple for line, blue for markers (dark theme)
-    plt.plot(df_sorted[x_col], df_sorted[y_col], marker='o', linewidth=3,
+    plt.plot(df_agg[x_col], df_agg[y_col], marker='o', linewidth=3,
              color='#9333ea', markersize=8, markerfacecolor='#3b82f6',
              markeredgecolor='#1a1a2e', markeredgewidth=2, alpha=0.9)
 
     # Fill area with purple gradient
-    plt.fill_between(df_sorted[x_col], df_sorted[y_col], alpha=0.2, color='#9333ea')
+    plt.fill_between(df_agg[x_col], df_agg[y_col], alpha=0.2, color='#9333ea')
 
     plt.title(title, fontsize=14, fontweight='bold', pad=15, color='#e5e7eb')
     plt.xlabel(x_col.title(), fontsize=12, color='#e5e7eb', fontweight='600')
@@ -123,7 +272,7 @@ def generate_line_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
 
 def generate_pie_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
     """Generate a dark-themed pie chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     df_agg = data.groupby(x_col)[y_col].sum().reset_index()
 
@@ -142,7 +291,7 @@ def generate_pie_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
 
 def generate_histogram(data: pd.DataFrame, y_col: str, title: str):
     """Generate a dark-themed histogram"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Use vibrant blue for dark theme
     plt.hist(data[y_col].dropna(), bins=30, edgecolor='#1a1a2e', linewidth=1.5,
@@ -161,7 +310,7 @@ def generate_histogram(data: pd.DataFrame, y_col: str, title: str):
 
 def generate_scatter_plot(data: pd.DataFrame, x_col: str, y_col: str, title: str):
     """Generate a dark-themed scatter plot"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     plt.scatter(data[x_col], data[y_col], alpha=0.7, s=60, color='#3b82f6', edgecolors='#9333ea', linewidth=1.5)
 
@@ -178,7 +327,7 @@ def generate_scatter_plot(data: pd.DataFrame, x_col: str, y_col: str, title: str
 
 def generate_boxplot(data: pd.DataFrame, y_col: str, x_col: str, title: str):
     """Generate a dark-themed box plot"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     if x_col:
         sns.boxplot(data=data, x=x_col, y=y_col, palette=GRADIENT_COLORS)
@@ -197,7 +346,7 @@ def generate_boxplot(data: pd.DataFrame, y_col: str, x_col: str, title: str):
 
 def generate_heatmap(data: pd.DataFrame, title: str):
     """Generate a dark-themed heatmap (correlation matrix)"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Select only numeric columns
     numeric_data = data.select_dtypes(include=[np.number])
@@ -217,7 +366,7 @@ def generate_heatmap(data: pd.DataFrame, title: str):
 
 def generate_kpi_card(data: pd.DataFrame, y_col: str, title: str, aggregation: str = 'sum'):
     """Generate a dark-themed KPI card"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     if aggregation == 'sum':
         value = data[y_col].sum()
@@ -255,18 +404,12 @@ def generate_kpi_card(data: pd.DataFrame, y_col: str, title: str, aggregation: s
     return save_plot_to_base64()
 
 
-def generate_area_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str, aggregation: str = 'sum'):
+def generate_area_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str,
+                        aggregation: str = 'sum', freq: str = None):
     """Generate a dark-themed area chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
-    df_sorted = data.sort_values(x_col)
-
-    if aggregation == 'sum':
-        df_agg = df_sorted.groupby(x_col)[y_col].sum().reset_index()
-    elif aggregation == 'avg':
-        df_agg = df_sorted.groupby(x_col)[y_col].mean().reset_index()
-    else:
-        df_agg = df_sorted.groupby(x_col)[y_col].sum().reset_index()
+    df_agg = prepare_time_series(data, x_col, [y_col], aggregation, freq)
 
     plt.fill_between(df_agg[x_col], df_agg[y_col], color=GRADIENT_COLORS[0], alpha=0.6)
     plt.plot(df_agg[x_col], df_agg[y_col], color=GRADIENT_COLORS[0], linewidth=3, alpha=0.9)
@@ -282,22 +425,20 @@ def generate_area_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str,
     return save_plot_to_base64()
 
 
-def generate_stacked_area_chart(data: pd.DataFrame, x_col: str, y_cols: list, title: str):
+def generate_stacked_area_chart(data: pd.DataFrame, x_col: str, y_cols: list, title: str,
+                                aggregation: str = 'sum', freq: str = None):
     """Generate a dark-themed stacked area chart"""
-    plt.figure(figsize=(10, 6))
-
-    df_sorted = data.sort_values(x_col)
+    plt.figure()
 
     if isinstance(y_cols, str):
         y_cols = [y_cols]
 
-    y_data = []
-    for col in y_cols[:5]:  # Limit to 5 series for clarity
-        if col in df_sorted.columns:
-            y_data.append(df_sorted[col].fillna(0))
+    # Limit to 5 series for clarity; duplicate timestamps are aggregated, not stacked
+    df_agg = prepare_time_series(data, x_col, y_cols[:5], aggregation, freq)
+    y_data = [df_agg[col].fillna(0) for col in df_agg.columns if col != x_col]
 
     if y_data:
-        plt.stackplot(df_sorted[x_col], *y_data, colors=GRADIENT_COLORS[:len(y_data)], alpha=0.8)
+        plt.stackplot(df_agg[x_col], *y_data, colors=GRADIENT_COLORS[:len(y_data)], alpha=0.8)
 
     plt.title(title, fontsize=14, fontweight='bold', pad=15, color='#e5e7eb')
     plt.xlabel(x_col.title(), fontsize=12, color='#e5e7eb', fontweight='600')
@@ -312,7 +453,7 @@ def generate_stacked_area_chart(data: pd.DataFrame, x_col: str, y_cols: list, ti
 
 def generate_bubble_chart(data: pd.DataFrame, x_col: str, y_col: str, size_col: str, title: str):
     """Generate a dark-themed bubble chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Normalize bubble sizes
     sizes = data[size_col].fillna(0)
@@ -334,7 +475,7 @@ def generate_bubble_chart(data: pd.DataFrame, x_col: str, y_col: str, size_col:
 
 def generate_donut_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
     """Generate a dark-themed donut chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     df_agg = data.groupby(x_col)[y_col].sum().reset_index()
     df_agg = df_agg.nlargest(8, y_col)  # Top 8 categories
@@ -362,7 +503,7 @@ def generate_donut_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str)
 
 def generate_waterfall_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
     """Generate a dark-themed waterfall chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     df_sorted = data.sort_values(x_col)
     values = df_sorted[y_col].values
@@ -393,7 +534,7 @@ def generate_waterfall_chart(data: pd.DataFrame, x_col: str, y_col: str, title:
 
 def generate_violin_plot(data: pd.DataFrame, y_col: str, x_col: str, title: str):
     """Generate a dark-themed violin plot"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Prepare data for violin plot
     categories = data[x_col].unique()[:8]  # Limit to 8 categories
@@ -432,7 +573,7 @@ def generate_treemap(data: pd.DataFrame, x_col: str, y_col: str, title: str):
         # Fallback to pie chart if squarify not available
         return generate_pie_chart(data, x_col, y_col, title)
 
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     df_agg = data.groupby(x_col)[y_col].sum().reset_index()
     df_agg = df_agg.nlargest(12, y_col)  # Top 12 categories
@@ -453,7 +594,7 @@ def generate_treemap(data: pd.DataFrame, x_col: str, y_col: str, title: str):
 
 def generate_radar_chart(data: pd.DataFrame, categories: list, values_col: str, title: str):
     """Generate a dark-themed radar/spider chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Prepare data
     if isinstance(categories, str):
@@ -483,7 +624,7 @@ def generate_radar_chart(data: pd.DataFrame, categories: list, values_col: str,
 
 def generate_funnel_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str):
     """Generate a dark-themed funnel chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     df_sorted = data.sort_values(y_col, ascending=False).head(8)
 
@@ -509,7 +650,7 @@ def generate_funnel_chart(data: pd.DataFrame, x_col: str, y_col: str, title: str
 
 def generate_gauge_chart(data: pd.DataFrame, y_col: str, title: str, aggregation: str = 'sum'):
     """Generate a dark-themed gauge/dial chart"""
-    plt.figure(figsize=(10, 6))
+    plt.figure()
 
     # Calculate value
     if aggregation == 'sum':
@@ -564,24 +705,415 @@ def generate_gauge_chart(data: pd.DataFrame, y_col: str, title: str, aggregation
     return save_plot_to_base64()
 
 
-def save_plot_to_base64():
-    """Save the current plot to base64 string with dark theme"""
+# ==========================================
+# MULTI-RESOLUTION OUTPUT
+# ==========================================
+# A drawn figure can be re-rasterized at any DPI without recomputing its
+# aggregates. In thumbnail mode the figure is kept in a small LRU cache so the
+# full-size image can be fetched later from /charts/<render_id>/image.
+RESOLUTION_MODES = {'full', 'thumbnail', 'both'}
+THUMBNAIL_DPI = 30                                                  # 10x6in → 300x180px tile
+MAX_IMAGE_SIDE_PX = 4000  # Longest side of any raster: max(figsize) * dpi
+FIGURE_CACHE_SIZE = int(os.environ.get('GRAIPH_FIGURE_CACHE_SIZE', '32'))
+
+figure_cache = OrderedDict()  # render_id → (drawn Figure, full-size DPI), oldest first
+figure_cache_lock = threading.Lock()
+
+# Per-thread render options set by the endpoint around each chart; the dev
+# server handles requests on several threads at once.
+#   dpi:           DPI for save_plot_to_base64 (default: rcParams)
+#   retain_figure: keep the drawn figure for re-rasterization
+#   figure:        last figure saved by save_plot_to_base64 on this thread
+render_state = threading.local()
+
+
+def figure_to_base64(fig, dpi: float) -> str:
+    """Rasterize a drawn figure to a base64 PNG with dark theme"""
     buf = io.BytesIO()
-    # Higher DPI for better quality, tight layout for uniform sizing
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight',
+    # Tight bbox for uniform sizing
+    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
                 facecolor='#1a1a2e', edgecolor='none')
     buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close()
+    return base64.b64encode(buf.read()).decode('utf-8')
+
+
+def save_plot_to_base64():
+    """Save the current plot to base64 string with dark theme"""
+    fig = plt.gcf()
+    img_base64 = figure_to_base64(fig, getattr(render_state, 'dpi', None) or plt.rcParams['savefig.dpi'])
+    if getattr(render_state, 'retain_figure', False):
+        # Still drawable after plt.close(); only pyplot's registry lets go of it
+        render_state.figure = fig
+    plt.close(fig)
     return img_base64
 
 
+def image_side_px(figsize, dpi: float) -> float:
+    """Longest side in pixels of a figure rasterized at `dpi`"""
+    return max(figsize) * dpi
+
+
+def cache_figure(fig, dpi: float) -> str:
+    """Keep a drawn figure for lazy full-size rendering; returns its render id"""
+    if fig is None:
+        raise ValueError("No drawn figure to cache")
+    render_id = uuid.uuid4().hex
+    with figure_cache_lock:
+        figure_cache[render_id] = (fig, dpi)
+        while len(figure_cache) > FIGURE_CACHE_SIZE:
+            figure_cache.popitem(last=False)
+    return render_id
+
+
+# ==========================================
+# PAYLOAD VALIDATION
+# ==========================================
+# Checked against the raw payload before any DataFrame is built, so a bad
+# chart plan is rejected without paying for parsing or rendering.
+# Per chart type: mapping fields that must name a column, the subset of those
+# that must hold numbers, and whether the renderer supports count aggregation
+# (so a text column can be counted).
+CHART_SCHEMAS = {
+    'bar':          {'required': ['x', 'y'], 'numeric': ['y'], 'count_ok': True},
+    'column':       {'required': ['x', 'y'], 'numeric': ['y'], 'count_ok': True},
+    'line':         {'required': ['x', 'y'], 'numeric': ['y'], 'count_ok': True},
+    'area':         {'required': ['x', 'y'], 'numeric': ['y'], 'count_ok': True},
+    'stacked_area': {'required': ['x', 'y_cols'], 'numeric': ['y_cols'], 'count_ok': True},
+    'pie':          {'required': ['x', 'y'], 'numeric': ['y']},
+    'donut':        {'required': ['x', 'y'], 'numeric': ['y']},
+    'histogram':    {'required': ['y'], 'numeric': ['y']},
+    'scatter':      {'required': ['x', 'y'], 'numeric': ['y']},
+    'bubble':       {'required': ['x', 'y', 'size'], 'numeric': ['y', 'size']},
+    'boxplot':      {'required': ['y'], 'numeric': ['y']},
+    'violin':       {'required': ['x', 'y'], 'numeric': ['y']},
+    'heatmap':      {'required': [], 'numeric': []},
+    'treemap':      {'required': ['x', 'y'], 'numeric': ['y']},
+    'waterfall':    {'required': ['x', 'y'], 'numeric': ['y']},
+    'funnel':       {'required': ['x', 'y'], 'numeric': ['y']},
+    'radar':        {'required': ['categories', 'y'], 'numeric': ['y']},
+    'gauge':        {'required': ['y'], 'numeric': ['y']},
+    'kpi':          {'required': ['y'], 'numeric': ['y'], 'count_ok': True},
+    'card':         {'required': ['y'], 'numeric': ['y'], 'count_ok': True},
+}
+NUMERIC_SAMPLE_VALUES = 100  # Non-null values inspected per column for the numeric check
+COLUMN_FIELDS = ['x', 'y', 'size']        # Mapping fields naming one column
+COLUMN_LIST_FIELDS = ['y_cols', 'categories']  # Mapping fields naming one or more columns
+AGGREGATED_FIELDS = ['y', 'y_cols']       # Fields reduced by mapping.aggregation
+
+
+def check_mapping_types(mapping: Dict[str, Any]) -> List[str]:
+    """Type-check mapping values before they are used as dict or set keys"""
+    errors = []
+    for field in COLUMN_FIELDS + ['aggregation', 'freq']:
+        value = mapping.get(field)
+        if value is not None and not isinstance(value, str):
+            errors.append(f"mapping.{field} must be a string")
+    for field in COLUMN_LIST_FIELDS:
+        value = mapping.get(field)
+        if value is not None and not isinstance(value, str) and not (
+                isinstance(value, list) and all(isinstance(v, str) for v in value)):
+            errors.append(f"mapping.{field} must be a string or a list of strings")
+    return errors
+
+
+def resolve_mapping_columns(mapping: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Resolve mapping fields to column lists, applying the same defaults as the renderers"""
+    x_col = mapping.get('x')
+    y_col = mapping.get('y')
+
+    def as_list(value):
+        if value is None:
+            return []
+        return [value] if isinstance(value, str) else list(value)
+
+    return {
+        'x': as_list(x_col),
+        'y': as_list(y_col),
+        'size': as_list(mapping.get('size', y_col)),
+        'y_cols': as_list(mapping.get('y_cols', y_col)),
+        'categories': as_list(mapping.get('categories', x_col)),
+    }
+
+
+def is_numeric_column(data_list: List[Dict[str, Any]], column: str) -> bool:
+    """Check the first non-null values of a column for numbers"""
+    seen_values = 0
+    for row in data_list:
+        value = row.get(column)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        seen_values += 1
+        if seen_values >= NUMERIC_SAMPLE_VALUES:
+            break
+    return seen_values > 0
+
+
+def validate_chart_spec(chart: Dict[str, Any], header: set, data_list: List[Dict[str, Any]]) -> List[str]:
+    """Return the problems with one chart spec (empty when it can be rendered)"""
+    chart_type = chart.get('type')
+    if not isinstance(chart_type, str) or chart_type not in CHART_SCHEMAS:
+        return [f"Unsupported chart type: {chart_type!r}"]
+    schema = CHART_SCHEMAS[chart_type]
+
+    mapping = chart.get('mapping') or {}
+    if not isinstance(mapping, dict):
+        return ["'mapping' must be an object"]
+
+    errors = check_mapping_types(mapping)
+    if errors:
+        return errors
+
+    aggregation = mapping.get('aggregation') or 'sum'  # The planner sends null for "none"
+    if aggregation not in AGGREGATION_FUNCS:
+        errors.append(f"Unsupported aggregation: {aggregation!r}")
+
+    freq = mapping.get('freq')
+    if freq is not None:
+        try:
+            pd.tseries.frequencies.to_offset(freq)
+        except (TypeError, ValueError):
+            errors.append(f"Invalid resampling frequency: {freq!r}")
+
+    figsize = chart.get('figsize')
+    figsize_ok = figsize is None or (
+        isinstance(figsize, (list, tuple)) and len(figsize) == 2
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) and v > 0 for v in figsize))
+    if not figsize_ok:
+        errors.append("'figsize' must be [width, height] in inches, both positive")
+
+    dpi = chart.get('dpi')
+    dpi_ok = dpi is None or (isinstance(dpi, (int, float)) and not isinstance(dpi, bool) and dpi > 0)
+    if not dpi_ok:
+        errors.append("'dpi' must be a positive number")
+
+    if figsize_ok and dpi_ok:
+        side = image_side_px(figsize or plt.rcParams['figure.figsize'],
+                             dpi or plt.rcParams['savefig.dpi'])
+        if side > MAX_IMAGE_SIDE_PX:
+            errors.append(f"'figsize' x 'dpi' gives a {side:.0f}px image side; "
+                          f"the limit is {MAX_IMAGE_SIDE_PX}px")
+
+    # Renderers that count rows accept any column for the counted field
+    counts_rows = aggregation == 'count' and schema.get('count_ok', False)
+    numeric_fields = [field for field in schema['numeric']
+                      if not (counts_rows and field in AGGREGATED_FIELDS)]
+
+    columns = resolve_mapping_columns(mapping)
+    # Required fields, plus any optional column the mapping names explicitly
+    fields = schema['required'] + [field for field in COLUMN_FIELDS + COLUMN_LIST_FIELDS
+                                   if field not in schema['required'] and mapping.get(field) is not None]
+    for field in fields:
+        if not columns[field]:
+            errors.append(f"Missing mapping field '{field}' for {chart_type} chart")
+            continue
+        for column in columns[field]:
+            if column not in header:
+                errors.append(f"Column '{column}' (mapping.{field}) not found in data")
+            elif field in numeric_fields and not is_numeric_column(data_list, column):
+                errors.append(f"Column '{column}' (mapping.{field}) must be numeric for {chart_type} chart")
+
+    return errors
+
+
+def validate_payload(data_list: List[Dict[str, Any]], chart_specs: List[Dict[str, Any]]):
+    """
+    Split chart specs into renderable charts and per-chart errors.
+
+    Returns (valid_charts, chart_errors) where each error is
+    {"id": ..., "type": ..., "errors": [...]}.
+    """
+    header = set()
+    for row in data_list:
+        header.update(row.keys())
+
+    valid_charts = []
+    chart_errors = []
+    for chart in chart_specs:
+        if not isinstance(chart, dict):
+            chart_errors.append({"id": None, "type": None, "errors": ["Chart spec must be an object"]})
+            continue
+
+        errors = validate_chart_spec(chart, header, data_list)
+        if errors:
+            chart_errors.append({"id": chart.get('id'), "type": chart.get('type'), "errors": errors})
+        else:
+            valid_charts.append(chart)
+
+    return valid_charts, chart_errors
+
+
+# ==========================================
+# MEMORY ACCOUNTING
+# ==========================================
+# Long-running workers are watched for leaked figures and growing RSS.
+# Limits are read from the environment; 0 disables a limit.
+MAX_REQUESTS = int(os.environ.get('GRAIPH_MAX_REQUESTS', '0'))    # Recycle after N graph requests
+MAX_RSS_MB = int(os.environ.get('GRAIPH_MAX_RSS_MB', '0'))        # Recycle above this RSS
+ADMIN_TOKEN = os.environ.get('GRAIPH_ADMIN_TOKEN')                # /admin/* is disabled until set
+
+if os.environ.get('GRAIPH_TRACEMALLOC') == '1':
+    tracemalloc.start()
+
+memory_state = {
+    "requests_served": 0,
+    "last_snapshot": None,  # Previous tracemalloc snapshot, for diffs
+}
+
+
+def close_figures_opened_since(fignums: set):
+    """Close every pyplot figure not in `fignums`, so a failed render cannot leak"""
+    for num in set(plt.get_fignums()) - fignums:
+        plt.close(num)
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        # No /proc (macOS): fall back to the peak RSS, reported in bytes there
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def memory_stats() -> Dict[str, Any]:
+    """Current memory accounting for this worker"""
+    stats = {
+        "pid": os.getpid(),
+        "open_figures": len(plt.get_fignums()),
+        "cached_figures": len(figure_cache),
+        "rss_bytes": current_rss_bytes(),
+        "requests_served": memory_state["requests_served"],
+        "limits": {"max_requests": MAX_REQUESTS, "max_rss_mb": MAX_RSS_MB},
+        "tracemalloc": {"tracing": tracemalloc.is_tracing()},
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        stats["tracemalloc"].update({"current_bytes": current, "peak_bytes": peak})
+    return stats
+
+
+def should_recycle_worker() -> bool:
+    """True once this worker has hit its request count or RSS limit"""
+    if MAX_REQUESTS and memory_state["requests_served"] >= MAX_REQUESTS:
+        return True
+    if MAX_RSS_MB and current_rss_bytes() >= MAX_RSS_MB * 1024 * 1024:
+        return True
+    return False
+
+
+def recycle_worker():
+    """Ask this process to shut down; the process manager (e.g. gunicorn) starts a fresh one"""
+    print(f"♻️  Recycling worker {os.getpid()}: {memory_stats()}")
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def admin_authorized() -> bool:
+    """Admin endpoints are disabled unless GRAIPH_ADMIN_TOKEN is set and sent as X-Admin-Token"""
+    if not ADMIN_TOKEN:
+        return False
+    token = request.headers.get('X-Admin-Token', '')
+    return hmac.compare_digest(token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8'))
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
     return jsonify({"status": "healthy", "service": "graph-generation"})
 
 
+@app.route('/charts/<render_id>/image', methods=['GET'])
+def chart_image(render_id: str):
+    """
+    Full-size image for a chart generated with "resolution": "thumbnail".
+    Query params: dpi (default: the chart's full-size DPI).
+
+    Figures live in a per-worker LRU cache; on 404 re-request the chart
+    with "resolution": "full".
+    """
+    with figure_cache_lock:
+        if render_id not in figure_cache:
+            return jsonify({"success": False, "error": "Unknown or expired render_id"}), 404
+        figure_cache.move_to_end(render_id)
+        fig, full_dpi = figure_cache[render_id]
+
+    dpi = request.args.get('dpi', full_dpi, type=float)
+    if not (dpi > 0 and image_side_px(fig.get_size_inches(), dpi) <= MAX_IMAGE_SIDE_PX):
+        return jsonify({
+            "success": False,
+            "error": f"'dpi' must be positive and keep the image side within {MAX_IMAGE_SIDE_PX}px"
+        }), 400
+
+    return jsonify({
+        "success": True,
+        "render_id": render_id,
+        "image": figure_to_base64(fig, dpi)
+    })
+
+
+@app.route('/admin/memory', methods=['GET'])
+def admin_memory():
+    """Memory accounting: open figures, RSS, request count and tracemalloc totals"""
+    if not admin_authorized():
+        return jsonify({"success": False, "error": "Unauthorized"}), 401
+    return jsonify({"success": True, "memory": memory_stats()})
+
+
+@app.route('/admin/memory/snapshot', methods=['POST', 'DELETE'])
+def admin_memory_snapshot():
+    """
+    POST: take a tracemalloc snapshot (starting tracing on first use) and
+    return the top allocation sites, diffed against the previous snapshot.
+    Query params: limit (default 20).
+
+    DELETE: stop tracing and drop the stored snapshot.
+    """
+    if not admin_authorized():
+        return jsonify({"success": False, "error": "Unauthorized"}), 401
+
+    if request.method == 'DELETE':
+        tracemalloc.stop()
+        memory_state["last_snapshot"] = None
+        return jsonify({"success": True, "tracing": False})
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        return jsonify({
+            "success": True,
+            "tracing": True,
+            "message": "Tracing started; take another snapshot to see allocations"
+        })
+
+    limit = request.args.get('limit', 20, type=int)
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ])
+    previous = memory_state["last_snapshot"]
+    memory_state["last_snapshot"] = snapshot
+
+    if previous is not None:
+        stats = snapshot.compare_to(previous, 'lineno')[:limit]
+        top = [{"location": str(stat.traceback), "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff, "count": stat.count,
+                "count_diff": stat.count_diff} for stat in stats]
+    else:
+        stats = snapshot.statistics('lineno')[:limit]
+        top = [{"location": str(stat.traceback), "size_bytes": stat.size,
+                "count": stat.count} for stat in stats]
+
+    return jsonify({
+        "success": True,
+        "tracing": True,
+        "compared_to_previous": previous is not None,
+        "top": top,
+        "memory": memory_stats()
+    })
+
+
 @app.route('/generate-graphs', methods=['POST'])
 def generate_graphs():
     """
@@ -598,10 +1130,14 @@ def generate_graphs():
                 "mapping": {
                     "x": "region",
                     "y": "revenue",
-                    "aggregation": "sum"
-                }
+                    "aggregation": "sum",
+                    "freq": "W"   # Optional: resampling frequency for datetime x-axes
+                },
+                "figsize": [10, 6],  # Optional: inches
+                "dpi": 100           # Optional: full-size resolution
             }
-        ]
+        ],
+        "resolution": "full"  # Optional: "full", "thumbnail" or "both"
     }
 
     Returns:
@@ -610,9 +1146,18 @@ def generate_graphs():
         "charts": [
             {
                 "id": "chart-1",
-                "image": "base64_encoded_image",
+                "image": "base64_encoded_image",       # "full" and "both"
+                "thumbnail": "base64_encoded_image",   # "thumbnail" and "both"
+                "render_id": "...",  # "thumbnail": full size from /charts/<render_id>/image
                 "title": "Revenue by Region"
             }
+        ],
+        "errors": [     # Charts that were skipped, with the reasons
+            {
+                "id": "chart-2",
+                "type": "histogram",
+                "errors": ["Column 'revnue' (mapping.y) not found in data"]
+            }
         ]
     }
     """
@@ -620,6 +1165,7 @@ def generate_graphs():
         payload = request.json
         data_list = payload.get('data', [])
         chart_specs = payload.get('charts', [])
+        resolution = payload.get('resolution', 'full')
 
         if not data_list or not chart_specs:
             return jsonify({
@@ -627,6 +1173,32 @@ def generate_graphs():
                 "error": "Missing data or chart specifications"
             }), 400
 
+        if not isinstance(data_list, list) or not all(isinstance(row, dict) for row in data_list) \
+                or not isinstance(chart_specs, list):
+            return jsonify({
+                "success": False,
+                "error": "'data' must be a list of objects and 'charts' a list"
+            }), 400
+
+        if not isinstance(resolution, str) or resolution not in RESOLUTION_MODES:
+            return jsonify({
+                "success": False,
+                "error": f"'resolution' must be one of {sorted(RESOLUTION_MODES)}"
+            }), 400
+
+        # Validate every chart against the raw rows before building the DataFrame
+        chart_specs, chart_errors = validate_payload(data_list, chart_specs)
+        if not chart_specs:
+            return jsonify({
+                "success": False,
+                "error": "No valid chart specifications",
+                "errors": chart_errors
+            }), 400
+
+        memory_state["requests_served"] += 1
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()  # Peak below is for this request only
+
         # Convert data to pandas DataFrame
         df = pd.DataFrame(data_list)
 
@@ -637,11 +1209,24 @@ def generate_graphs():
             chart_id = chart.get('id')
             chart_type = chart.get('type')
             title = chart.get('title', 'Untitled Chart')
-            mapping = chart.get('mapping', {})
+            mapping = chart.get('mapping') or {}
 
             x_col = mapping.get('x')
             y_col = mapping.get('y')
             aggregation = mapping.get('aggregation', 'sum')
+            freq = mapping.get('freq')  # Optional resampling frequency for time axes
+            open_figures = set(plt.get_fignums())
+
+            # Per-chart size and DPI; thumbnails rasterize at low DPI first
+            full_dpi = chart.get('dpi') or plt.rcParams['savefig.dpi']
+            chart_rc = {
+                'figure.figsize': chart.get('figsize') or plt.rcParams['figure.figsize'],
+            }
+            saved_rc = {key: plt.rcParams[key] for key in chart_rc}
+            plt.rcParams.update(chart_rc)
+            render_state.dpi = full_dpi if resolution == 'full' else THUMBNAIL_DPI
+            render_state.retain_figure = resolution != 'full'
+            render_state.figure = None
 
             try:
                 # Generate chart based on type
@@ -649,7 +1234,7 @@ def generate_graphs():
                     image_base64 = generate_bar_chart(df, x_col, y_col, title, aggregation)
 
                 elif chart_type == 'line':
-                    image_base64 = generate_line_chart(df, x_col, y_col, title)
+                    image_base64 = generate_line_chart(df, x_col, y_col, title, aggregation, freq)
 
                 elif chart_type == 'pie':
                     image_base64 = generate_pie_chart(df, x_col, y_col, title)
@@ -673,11 +1258,11 @@ def generate_graphs():
                     image_base64 = generate_kpi_card(df, y_col, title, aggregation)
 
                 elif chart_type == 'area':
-                    image_base64 = generate_area_chart(df, x_col, y_col, title, aggregation)
+                    image_base64 = generate_area_chart(df, x_col, y_col, title, aggregation, freq)
 
                 elif chart_type == 'stacked_area':
                     y_cols = mapping.get('y_cols', [y_col])
-                    image_base64 = generate_stacked_area_chart(df, x_col, y_cols, title)
+                    image_base64 = generate_stacked_area_chart(df, x_col, y_cols, title, aggregation, freq)
 
                 elif chart_type == 'bubble':
                     size_col = mapping.get('size', y_col)
@@ -706,23 +1291,51 @@ def generate_graphs():
                     # Unsupported chart type, skip
                     continue
 
-                generated_charts.append({
+                chart_result = {
                     "id": chart_id,
                     "title": title,
-                    "image": image_base64,
                     "type": chart_type
-                })
+                }
+                if resolution == 'full':
+                    chart_result["image"] = image_base64
+                else:
+                    fig = render_state.figure
+                    if fig is None:
+                        raise RuntimeError("Chart figure was not retained for full-size rendering")
+                    chart_result["thumbnail"] = image_base64
+                    if resolution == 'both':
+                        # Same drawn figure, only re-rasterized
+                        chart_result["image"] = figure_to_base64(fig, full_dpi)
+                    else:
+                        chart_result["render_id"] = cache_figure(fig, full_dpi)
+
+                generated_charts.append(chart_result)
 
             except Exception as e:
                 print(f"Error generating chart {chart_id}: {str(e)}")
-                # Skip failed charts
+                # Skip failed charts, but report why
+                chart_errors.append({"id": chart_id, "type": chart_type, "errors": [str(e)]})
                 continue
 
-        return jsonify({
+            finally:
+                # A chart that raised before save_plot_to_base64 leaves its figure open
+                close_figures_opened_since(open_figures)
+                plt.rcParams.update(saved_rc)
+                render_state.dpi = None
+                render_state.retain_figure = False
+                render_state.figure = None
+
+        response = jsonify({
             "success": True,
             "charts": generated_charts,
-            "total": len(generated_charts)
+            "total": len(generated_charts),
+            "errors": chart_errors
         })
+        if tracemalloc.is_tracing():
+            response.headers['X-Peak-Alloc-Bytes'] = str(tracemalloc.get_traced_memory()[1])
+        if should_recycle_worker():
+            response.call_on_close(recycle_worker)
+        return response
 
     except Exception as e:
         return jsonify({
@@ -0,0 +1,51 @@
+import matplotlib.pyplot as plt
+
+import app
+
+
+def test_admin_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(app, 'ADMIN_TOKEN', None)
+    client = app.app.test_client()
+    assert client.get('/admin/memory').status_code == 401
+    assert client.post('/admin/memory/snapshot').status_code == 401
+
+
+def test_admin_requires_matching_token(monkeypatch):
+    monkeypatch.setattr(app, 'ADMIN_TOKEN', 'secret')
+    client = app.app.test_client()
+    assert client.get('/admin/memory', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+    response = client.get('/admin/memory', headers={'X-Admin-Token': 'secret'})
+    assert response.status_code == 200
+    assert 'open_figures' in response.get_json()['memory']
+
+
+DATA = [{'region': 'East', 'revenue': 100.0}, {'region': 'West', 'revenue': 250.0}]
+CHART = {'id': 'c1', 'type': 'bar', 'mapping': {'x': 'region', 'y': 'revenue'}}
+
+
+def test_failed_render_closes_its_figure(monkeypatch):
+    def failing_bar_chart(*args, **kwargs):
+        plt.figure()
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(app, 'generate_bar_chart', failing_bar_chart)
+    before = plt.get_fignums()
+    body = app.app.test_client().post('/generate-graphs',
+                                      json={'data': DATA, 'charts': [CHART]}).get_json()
+    assert body['errors'][0]['errors'] == ['boom']
+    assert plt.get_fignums() == before
+
+
+def test_worker_recycles_after_max_requests(monkeypatch):
+    kills = []
+    monkeypatch.setattr(app.os, 'kill', lambda pid, sig: kills.append((pid, sig)))
+    monkeypatch.setattr(app, 'MAX_REQUESTS', 2)
+    monkeypatch.setitem(app.memory_state, 'requests_served', 0)
+    assert not app.should_recycle_worker()
+
+    client = app.app.test_client()
+    client.post('/generate-graphs', json={'data': DATA, 'charts': [CHART]}).close()
+    assert kills == []
+    client.post('/generate-graphs', json={'data': DATA, 'charts': [CHART]}).close()
+    assert app.should_recycle_worker()
+    assert kills == [(app.os.getpid(), app.signal.SIGTERM)]
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+import app
+
+DATA = [{'region': 'East', 'revenue': 100.0}, {'region': 'West', 'revenue': 250.0}]
+CHART = {'id': 'c1', 'type': 'bar', 'mapping': {'x': 'region', 'y': 'revenue'}}
+
+
+def test_thumbnail_then_lazy_full_image():
+    client = app.app.test_client()
+    body = client.post('/generate-graphs', json={'data': DATA, 'charts': [CHART],
+                                                 'resolution': 'thumbnail'}).get_json()
+    chart = body['charts'][0]
+    assert 'thumbnail' in chart and 'image' not in chart
+
+    full = client.get(f"/charts/{chart['render_id']}/image")
+    assert full.status_code == 200
+    assert len(full.get_json()['image']) > len(chart['thumbnail'])
+
+
+def test_unknown_render_id_is_404():
+    client = app.app.test_client()
+    assert client.get('/charts/missing/image').status_code == 404
+
+
+def test_figsize_and_dpi_capped_by_output_pixels():
+    header = {'region', 'revenue'}
+    ok = dict(CHART, figsize=[20, 10], dpi=200)
+    assert app.validate_chart_spec(ok, header, DATA) == []
+    too_big = dict(CHART, figsize=[40, 40], dpi=600)
+    assert app.validate_chart_spec(too_big, header, DATA)
+    assert app.validate_chart_spec(dict(CHART, dpi=500), header, DATA)
+
+
+def test_lazy_full_image_dpi_capped():
+    client = app.app.test_client()
+    body = client.post('/generate-graphs', json={'data': DATA, 'charts': [CHART],
+                                                 'resolution': 'thumbnail'}).get_json()
+    render_id = body['charts'][0]['render_id']
+    assert client.get(f'/charts/{render_id}/image?dpi=600').status_code == 400
+    assert client.get(f'/charts/{render_id}/image?dpi=nan').status_code == 400
+
+
+def test_render_state_is_per_thread():
+    app.render_state.retain_figure = True
+    seen = []
+    worker = threading.Thread(
+        target=lambda: seen.append(getattr(app.render_state, 'retain_figure', False)))
+    worker.start()
+    worker.join()
+    app.render_state.retain_figure = False
+    assert seen == [False]
+
+
+def test_cache_figure_rejects_missing_figure():
+    with pytest.raises(ValueError):
+        app.cache_figure(None, 100)
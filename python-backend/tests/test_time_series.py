@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+import app
+
+
+def test_parse_datetime_column_keeps_labels_categorical():
+    assert app.parse_datetime_column(pd.Series(['January', 'February'])) is None
+    assert app.parse_datetime_column(pd.Series([1, 2, 3])) is None
+
+
+def test_parse_datetime_column_handles_mixed_utc_offsets():
+    series = pd.Series(['2024-03-30T12:00+01:00', '2024-03-31T12:00+02:00'])
+    parsed = app.parse_datetime_column(series)
+    assert parsed is not None
+    assert parsed.notna().all()
+
+
+def test_pick_resample_freq_skips_small_series():
+    times = pd.Series(pd.date_range('2024-01-01', periods=50, freq='h'))
+    assert app.pick_resample_freq(times, fig_width=10) is None
+
+
+def test_pick_resample_freq_fits_figure_width():
+    times = pd.Series(pd.date_range('2024-01-01', periods=5000, freq='h'))
+    assert app.pick_resample_freq(times, fig_width=10) == 'W'
+
+
+def test_limit_resample_freq_coarsens_tiny_buckets():
+    times = pd.Series(pd.date_range('2024-01-01', periods=5, freq='D'))
+    assert app.limit_resample_freq(times, '1us', fig_width=10) == '5min'
+    assert app.limit_resample_freq(times, 'D', fig_width=10) == 'D'
+
+
+def test_prepare_time_series_aggregates_duplicate_timestamps():
+    data = pd.DataFrame({
+        'date': ['2024-01-02', '2024-01-01', '2024-01-01'],
+        'a': [1.0, 2.0, 3.0],
+    })
+    result = app.prepare_time_series(data, 'date', ['a'])
+    assert list(result['a']) == [5.0, 1.0]
+    assert result['date'].is_monotonic_increasing
+
+
+def test_prepare_time_series_keeps_gaps_as_nan():
+    data = pd.DataFrame({
+        'date': ['2024-01-01', '2024-01-08', '2024-03-04'],
+        'a': [1.0, 2.0, 3.0],
+    })
+    result = app.prepare_time_series(data, 'date', ['a'], freq='W')
+    assert len(result) > 3
+    assert np.isnan(result['a']).any()
+
+
+def test_prepare_time_series_mixed_offsets_renders():
+    data = pd.DataFrame({
+        'ts': ['2024-03-30T12:00+01:00', '2024-03-31T12:00+02:00'],
+        'a': [1.0, 2.0],
+    })
+    result = app.prepare_time_series(data, 'ts', ['a'])
+    assert list(result['a']) == [1.0, 2.0]
+
+
+def test_prepare_time_series_resamples_mixed_offsets():
+    # Hourly local-time export across the March DST change, > max_points rows
+    local = pd.date_range('2024-03-25', periods=400, freq='h', tz='Europe/Berlin')
+    data = pd.DataFrame({
+        'ts': [t.isoformat() for t in local],
+        'a': [1.0] * len(local),
+    })
+    result = app.prepare_time_series(data, 'ts', ['a'], fig_width=10)
+    assert pd.api.types.is_datetime64_any_dtype(result['ts'])
+    assert len(result) < len(data)
+    assert result['a'].sum() == len(data)
@@ -0,0 +1,95 @@
+import app
+
+DATA = [
+    {'region': 'East', 'order_id': 'A1', 'revenue': 100.0},
+    {'region': 'West', 'order_id': 'A2', 'revenue': 250.0},
+]
+HEADER = {'region', 'order_id', 'revenue'}
+
+
+def errors_for(chart, data=DATA, header=HEADER):
+    return app.validate_chart_spec(chart, header, data)
+
+
+def test_valid_bar_chart():
+    assert errors_for({'type': 'bar', 'mapping': {'x': 'region', 'y': 'revenue'}}) == []
+
+
+def test_unknown_type_and_column():
+    assert errors_for({'type': 'sparkline', 'mapping': {}})
+    assert errors_for({'type': 'histogram', 'mapping': {'y': 'revnue'}}) == [
+        "Column 'revnue' (mapping.y) not found in data"
+    ]
+
+
+def test_numeric_column_required():
+    assert errors_for({'type': 'kpi', 'mapping': {'y': 'region'}})
+
+
+def test_count_aggregation_accepts_text_column():
+    chart = {'type': 'bar', 'mapping': {'x': 'region', 'y': 'order_id', 'aggregation': 'count'}}
+    assert errors_for(chart) == []
+
+
+def test_count_on_text_column_rejected_where_renderer_ignores_count():
+    for chart_type in ['gauge', 'pie', 'histogram']:
+        chart = {'type': chart_type,
+                 'mapping': {'x': 'region', 'y': 'order_id', 'aggregation': 'count'}}
+        assert errors_for(chart) == [
+            f"Column 'order_id' (mapping.y) must be numeric for {chart_type} chart"
+        ]
+
+
+def test_count_on_text_column_renders():
+    client = app.app.test_client()
+    charts = [{'id': chart_type, 'type': chart_type,
+               'mapping': {'x': 'region', 'y': 'order_id', 'aggregation': 'count'}}
+              for chart_type in ['bar', 'line', 'area', 'kpi']]
+    body = client.post('/generate-graphs', json={'data': DATA, 'charts': charts}).get_json()
+    assert body['total'] == 4
+    assert body['errors'] == []
+
+
+def test_sparse_numeric_column():
+    data = [{'value': None}] * 150 + [{'value': 3.5}]
+    chart = {'type': 'histogram', 'mapping': {'y': 'value'}}
+    assert errors_for(chart, data, {'value'}) == []
+
+
+def test_optional_column_is_checked():
+    chart = {'type': 'boxplot', 'mapping': {'x': 'regoin', 'y': 'revenue'}}
+    assert errors_for(chart) == ["Column 'regoin' (mapping.x) not found in data"]
+
+
+def test_malformed_mapping_types():
+    for mapping in [{'x': ['region'], 'y': 'revenue'},
+                    {'x': 'region', 'y': {'a': 1}},
+                    {'x': 'region', 'y': 5},
+                    {'x': 'region', 'y': 'revenue', 'aggregation': ['sum']},
+                    {'x': 'region', 'y_cols': [1, 2]}]:
+        assert errors_for({'type': 'bar', 'mapping': mapping}), mapping
+    assert errors_for({'type': ['bar'], 'mapping': {'x': 'region', 'y': 'revenue'}})
+
+
+def test_malformed_payload_returns_chart_errors_not_500():
+    client = app.app.test_client()
+    charts = [{'id': 'bad', 'type': 'bar', 'mapping': {'x': 'region', 'y': 5}},
+              {'id': 'ok', 'type': 'kpi', 'mapping': {'y': 'revenue'}}]
+    response = client.post('/generate-graphs', json={'data': DATA, 'charts': charts})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [chart['id'] for chart in body['charts']] == ['ok']
+    assert [error['id'] for error in body['errors']] == ['bad']
+
+    response = client.post('/generate-graphs', json={'data': DATA, 'charts': charts,
+                                                     'resolution': ['full']})
+    assert response.status_code == 400
+
+
+def test_null_mapping_does_not_fail_request():
+    client = app.app.test_client()
+    charts = [{'id': 'heat', 'type': 'heatmap', 'mapping': None},
+              {'id': 'ok', 'type': 'kpi', 'mapping': {'y': 'revenue'}}]
+    response = client.post('/generate-graphs', json={'data': DATA, 'charts': charts})
+    assert response.status_code == 200
+    assert 'ok' in [chart['id'] for chart in response.get_json()['charts']]
@@ -83,6 +83,7 @@ export interface ChartMapping {
   series?: string | null;
   aggregation?: 'sum' | 'avg' | 'count' | 'min' | 'max' | null;
   groupBy?: string | null;
+  freq?: string | null;
 }
 
 export interface ChartConstraints {